@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional, Union
+from dataclasses import astuple, dataclass, fields
+from typing import Iterator, Optional, Sequence, Union
 
 
 @dataclass
@@ -20,6 +20,184 @@ class InfoMessage:
                 f'Потрачено ккал: {self.calories:.3f}.')
 
 
+class InfoMessageRow:
+    """
+    Ленивое представление строки пакета в виде InfoMessage.
+    FIELDS: Поля InfoMessage в порядке аргументов.
+    """
+
+    __slots__ = ('_columns', '_index')
+
+    FIELDS: tuple[str, ...] = tuple(field.name
+                                    for field in fields(InfoMessage))
+
+    def __init__(self, columns: dict[str, list], index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    @property
+    def training_type(self) -> str:
+        return self._columns['training_type'][self._index]
+
+    @property
+    def duration(self) -> float:
+        return self._columns['duration'][self._index]
+
+    @property
+    def distance(self) -> float:
+        return self._columns['distance'][self._index]
+
+    @property
+    def speed(self) -> float:
+        return self._columns['speed'][self._index]
+
+    @property
+    def calories(self) -> float:
+        return self._columns['calories'][self._index]
+
+    def get_message(self) -> str:
+        return InfoMessage.get_message(self)
+
+    def _astuple(self) -> tuple:
+        return tuple(self._columns[field][self._index]
+                     for field in self.FIELDS)
+
+    def to_info_message(self) -> InfoMessage:
+        """Создать полноценный экземпляр InfoMessage."""
+        return InfoMessage(*self._astuple())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, InfoMessageRow):
+            return self._astuple() == other._astuple()
+        if isinstance(other, InfoMessage):
+            return self._astuple() == astuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{field}={value!r}' for field, value
+                           in zip(self.FIELDS, self._astuple()))
+        return f'{self.__class__.__name__}({values})'
+
+
+class InfoMessageBatch:
+    """
+    Пакет информационных сообщений в виде параллельных массивов.
+    Срезы и выборки по типу тренировки разделяют массивы с исходным
+    пакетом и не копируют данные; добавлять строки в них нельзя.
+    FIELDS: Поля InfoMessage в порядке аргументов.
+    """
+
+    FIELDS: tuple[str, ...] = InfoMessageRow.FIELDS
+
+    def __init__(self,
+                 columns: Optional[dict[str, list]] = None,
+                 rows: Optional[Sequence[int]] = None) -> None:
+        """
+        columns: Массивы значений для каждого поля из FIELDS.
+        rows: Индексы строк пакета в массивах. Если заданы, пакет
+        становится представлением только для чтения.
+        """
+        if columns is None:
+            columns = {field: [] for field in self.FIELDS}
+        if set(columns) != set(self.FIELDS):
+            raise KeyError(f'Пакет должен содержать поля {self.FIELDS}')
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError('Массивы пакета должны быть одной длины.')
+        size = lengths.pop()
+        if rows and not (0 <= min(rows) and max(rows) < size):
+            raise ValueError('Индексы строк выходят за границы пакета.')
+        self._columns = columns
+        self._is_view = rows is not None
+        self._rows = range(size) if rows is None else rows
+
+    @classmethod
+    def from_trainings(cls, trainings: list['Training']) -> 'InfoMessageBatch':
+        """Собрать пакет результатов по списку тренировок."""
+        batch = cls()
+        for training in trainings:
+            batch.append(training)
+        return batch
+
+    def append(self, training: 'Training') -> None:
+        """Добавить результаты тренировки без создания InfoMessage."""
+        if self._is_view:
+            raise ValueError('Нельзя добавлять строки в представление пакета.')
+        self._columns['training_type'].append(training.__class__.__name__)
+        self._columns['duration'].append(training.duration)
+        self._columns['distance'].append(training.get_distance())
+        self._columns['speed'].append(training.get_mean_speed())
+        self._columns['calories'].append(training.get_spent_calories())
+        self._rows = range(len(self._columns['training_type']))
+
+    def column(self, field: str) -> list:
+        """Получить значения одного поля для всех строк пакета."""
+        values = self._columns[field]
+        if self._rows == range(len(values)):
+            return values[:]
+        return [values[i] for i in self._rows]
+
+    def sum(self, field: str) -> float:
+        """Сумма значений числового поля по всем строкам пакета."""
+        if field == 'training_type':
+            raise KeyError('Поле training_type нельзя суммировать.')
+        values = self._columns[field]
+        if self._rows == range(len(values)):
+            return sum(values)
+        return sum(values[i] for i in self._rows)
+
+    def mean(self, field: str) -> float:
+        """Среднее значение числового поля по всем строкам пакета."""
+        if not self._rows:
+            raise ValueError('Нельзя посчитать среднее для пустого пакета.')
+        return self.sum(field) / len(self._rows)
+
+    def filter(self, training_type: str) -> 'InfoMessageBatch':
+        """Отобрать строки пакета с заданным типом тренировки."""
+        types = self._columns['training_type']
+        rows = [i for i in self._rows if types[i] == training_type]
+        return InfoMessageBatch(self._columns, rows)
+
+    def concat(self, other: 'InfoMessageBatch') -> 'InfoMessageBatch':
+        """
+        Объединить два пакета.
+        Пакеты с общими массивами (срезы и выборки одного пакета) и
+        пакет с пустым операндом не копируются: результат становится
+        представлением только для чтения. Два пустых пакета дают новый
+        пустой пакет, в который можно добавлять строки.
+        """
+        if not self and not other:
+            return InfoMessageBatch()
+        if self._columns is other._columns:
+            return InfoMessageBatch(self._columns,
+                                    list(self._rows) + list(other._rows))
+        if not other:
+            return InfoMessageBatch(self._columns, self._rows)
+        if not self:
+            return InfoMessageBatch(other._columns, other._rows)
+        return InfoMessageBatch({field: self.column(field)
+                                 + other.column(field)
+                                 for field in self.FIELDS})
+
+    def __add__(self, other: 'InfoMessageBatch') -> 'InfoMessageBatch':
+        return self.concat(other)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[InfoMessageRow]:
+        for i in self._rows:
+            yield InfoMessageRow(self._columns, i)
+
+    def __getitem__(self, key: Union[int, slice]
+                    ) -> Union[InfoMessageRow, 'InfoMessageBatch']:
+        if isinstance(key, slice):
+            return InfoMessageBatch(self._columns, self._rows[key])
+        return InfoMessageRow(self._columns, self._rows[key])
+
+
 class Training:
     """
     Базовый класс тренировки.
@@ -451,3 +451,123 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def make_batch():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [9000, 1, 75]),
+    ]
+    trainings = [homework.read_package(*package) for package in packages]
+    return trainings, homework.InfoMessageBatch.from_trainings(trainings)
+
+
+def test_InfoMessageBatch_rows():
+    trainings, batch = make_batch()
+    assert len(batch) == len(trainings)
+    for row, training in zip(batch, trainings):
+        info = training.show_training_info()
+        assert row.get_message() == info.get_message(), (
+            'Строка `InfoMessageBatch` должна возвращать то же сообщение, '
+            'что и `InfoMessage`.'
+        )
+        assert row.to_info_message() == info
+    assert batch[-1].training_type == 'Running'
+
+
+def test_InfoMessageBatch_aggregates():
+    trainings, batch = make_batch()
+    calories = [training.get_spent_calories() for training in trainings]
+    assert batch.sum('calories') == pytest.approx(sum(calories))
+    assert batch.mean('calories') == pytest.approx(
+        sum(calories) / len(calories)
+    )
+    running = batch.filter('Running')
+    assert running.column('training_type') == ['Running', 'Running']
+    assert running.sum('distance') == pytest.approx(
+        trainings[1].get_distance() + trainings[3].get_distance()
+    )
+    with pytest.raises(KeyError):
+        batch.sum('training_type')
+    with pytest.raises(ValueError):
+        batch.filter('Unknown').mean('speed')
+
+
+def test_InfoMessageBatch_row_compare():
+    trainings, batch = make_batch()
+    info = trainings[0].show_training_info()
+    assert batch[0] == batch[0]
+    assert batch[0] == info
+    assert batch[0] != batch[1]
+    assert repr(batch[0]).startswith('InfoMessageRow(training_type=')
+
+
+def test_InfoMessageBatch_slice_and_concat():
+    _, batch = make_batch()
+    part = batch[1:3]
+    assert part.column('training_type') == ['Running', 'SportsWalking']
+    assert part[::-1][0].training_type == 'SportsWalking'
+    assert batch.filter('Running')[1] == batch[3]
+    with pytest.raises(ValueError):
+        part.append(homework.read_package('RUN', [15000, 1, 75]))
+    joined = batch[:1] + batch[3:]
+    assert joined.column('training_type') == ['Swimming', 'Running']
+    assert joined.sum('speed') == pytest.approx(
+        batch[0].speed + batch[3].speed
+    )
+
+
+def test_InfoMessageBatch_views_track_owner():
+    _, batch = make_batch()
+    part = batch[1:3]
+    batch.append(homework.read_package('SWM', [720, 1, 80, 25, 40]))
+    assert len(part) == 2
+    assert list(part) == list(batch[1:3]), (
+        'Срез `InfoMessageBatch` должен ссылаться на строки исходного пакета.'
+    )
+
+
+def test_InfoMessageBatch_full_slice_is_read_only():
+    _, batch = make_batch()
+    size = len(batch)
+    with pytest.raises(ValueError):
+        batch[:].append(homework.read_package('RUN', [15000, 1, 75]))
+    assert len(batch) == size
+    batch.append(homework.read_package('RUN', [15000, 1, 75]))
+    assert len(batch) == size + 1
+
+
+def test_InfoMessageBatch_concat_empty_does_not_alias():
+    _, batch = make_batch()
+    size = len(batch)
+    empty = homework.InfoMessageBatch()
+    for joined in (batch + empty, empty + batch):
+        assert list(joined) == list(batch)
+        with pytest.raises(ValueError):
+            joined.append(homework.read_package('RUN', [15000, 1, 75]))
+    assert len(batch) == size
+
+
+def test_InfoMessageBatch_concat_shared_storage():
+    _, batch = make_batch()
+    joined = batch[:1] + batch.filter('Running')
+    assert list(joined) == [batch[0], batch[1], batch[3]]
+    with pytest.raises(ValueError):
+        joined.append(homework.read_package('RUN', [15000, 1, 75]))
+    batch.append(homework.read_package('WLK', [9000, 1, 75, 180]))
+    assert list(joined) == [batch[0], batch[1], batch[3]]
+
+
+def test_InfoMessageBatch_concat_both_empty():
+    joined = homework.InfoMessageBatch() + homework.InfoMessageBatch()
+    assert len(joined) == 0
+    joined.append(homework.read_package('RUN', [15000, 1, 75]))
+    assert len(joined) == 1
+
+
+def test_InfoMessageBatch_rows_out_of_range():
+    columns = {field: [1] for field in homework.InfoMessageBatch.FIELDS}
+    with pytest.raises(ValueError):
+        homework.InfoMessageBatch(columns, range(5))